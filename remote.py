@@ -7,13 +7,22 @@ import serial.threaded
 import matplotlib
 import matplotlib.pyplot as plt
 
+import numpy as np
+
 import tkinter
 
+import bisect
+import datetime
+import itertools
+import os
+import queue
+import re
 import sys
 import time
 import csv
 
-from threading import Thread
+from collections import namedtuple
+from threading import Thread, Event
 import logging
 
 
@@ -25,10 +34,72 @@ logger.setLevel(logging.DEBUG)
 FIELD_NAMES = 'Time,Temp0,Temp1,Temp2,Temp3,Set,Actual,Heat,Fan,ColdJ,Mode'
 TTYs = ('/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyUSB2')
 BAUD_RATE = 115200
+DRAW_INTERVAL = 0.25
+PORT_CACHE_PATH = os.path.expanduser('~/.cache/t962_port')
+LOG_DIR = 'logs/'
+
+# One immutable record per status line. Much smaller than a per-line
+# dict (no hash table, no per-key lookups) and indexable positionally
+# by the column store below.
+Status = namedtuple('Status', FIELD_NAMES.split(','))
+
+
+def timestamp(dt=None):
+	if dt is None:
+		dt = datetime.datetime.now()
+
+	return dt.strftime('%Y-%m-%d-%H%M%S')
+
+
+def logname(filetype, profile):
+	return '%s%s-%s.%s' % (
+		LOG_DIR,
+		timestamp(),
+		profile.replace(' ', '_').replace('/', '_'),
+		filetype
+	)
+
+
+def read_cached_port():
+	try:
+		with open(PORT_CACHE_PATH) as f:
+			return f.read().strip() or None
+	except OSError:
+		return None
+
+
+def write_cached_port(devname):
+	try:
+		os.makedirs(os.path.dirname(PORT_CACHE_PATH), exist_ok=True)
+		with open(PORT_CACHE_PATH, 'w') as f:
+			f.write(devname)
+	except OSError:
+		pass
+
+
+def set_low_latency(devname):
+	# FTDI adapters default to a 16ms latency timer, which delays the
+	# short messages the oven sends. Drop it to 1ms where the sysfs
+	# knob exists (Linux only); best effort everywhere else.
+	path = '/sys/bus/usb-serial/devices/%s/latency_timer' % os.path.basename(devname)
+	try:
+		with open(path, 'w') as f:
+			f.write('1')
+	except OSError:
+		pass
 
 
 def get_tty():
-	for devname in TTYs:
+	# Try whichever port worked last time first, so a successful run
+	# doesn't pay for failed open() attempts on the earlier entries.
+	candidates = list(TTYs)
+	cached = read_cached_port()
+	if cached is not None:
+		if cached in candidates:
+			candidates.remove(cached)
+		candidates.insert(0, cached)
+
+	for devname in candidates:
 		try:
 			ser = serial.Serial()
 
@@ -44,6 +115,9 @@ def get_tty():
 
 			print('Using serial port %s' % ser.name)
 
+			write_cached_port(devname)
+			set_low_latency(devname)
+
 			return ser
 
 		except Exception as e:
@@ -54,23 +128,76 @@ def get_tty():
 	return None
 
 class T962Connection(serial.threaded.LineReader):
+	# How long to wait for the command echo before giving up and
+	# sending the next command anyway.
+	ACK_TIMEOUT = 0.1
+
+	# All non-status lines the oven emits, folded into one anchored
+	# alternation so the hot path (a status line) pays for a single
+	# C-level match instead of a chain of startswith calls.
+	DISPATCH_RE = re.compile(r'^(?:(?P<ack>#)'
+							 r'|(?P<started>Starting reflow with profile: )'
+							 r'|(?P<done>Reflow done)'
+							 r'|(?P<interrupted>Reflow interrupted by keypress)'
+							 r'|(?P<selected>Selected profile))')
+
 	def __init__(self, consumer):
 		super(serial.threaded.LineReader, self).__init__()
 		self.consumer = consumer
+		self._status_batch = None
+		self._ack_event = Event()
+
+	def data_received(self, data):
+		# Drain the whole RX chunk at once. Status lines found in it are
+		# collected and handed to the consumer as one batch, so a burst
+		# of serial traffic costs a single bulk append and one dirty
+		# flag instead of one consumer call per line.
+		self.buffer.extend(data)
+		self._status_batch = []
+		try:
+			while self.TERMINATOR in self.buffer:
+				packet, self.buffer = self.buffer.split(self.TERMINATOR, 1)
+				self.handle_packet(packet)
+
+			self._flush_status_batch()
+		finally:
+			self._status_batch = None
+
+	def _flush_status_batch(self):
+		batch = self._status_batch
+		if not batch:
+			return
 
-	def send_command(self, cmd):
+		self._status_batch = []
+		try:
+			self.consumer.status_batch_received(batch)
+		except Exception as e:
+			logger.error(e, exc_info=True)
+
+	def send_command(self, cmd, wait=True):
+		# The oven echoes every command back as a '#' comment line, so
+		# wait for that instead of sleeping a fixed second per command.
+		if wait:
+			self._ack_event.clear()
 		self.write_line(cmd)
-		time.sleep(1)
+		if wait:
+			self._ack_event.wait(self.ACK_TIMEOUT)
 
 	def set_profile(self, index, setpoints):
 		if len(setpoints) > 48:
 			error("Too many setpoints")
 
 		self.send_command(f"select profile {index}")
+
+		# Pipeline the setpoint writes and wait once for the trailing
+		# echo rather than once per setpoint.
 		for i, temp in enumerate(setpoints):
-			self.send_command(f"set setpoint {i} {int(temp)}")
+			self.send_command(f"set setpoint {i} {int(temp)}", wait=False)
 		for i in range(len(setpoints), 48):
-			self.send_command(f"set setpoint {i} 0")
+			self.send_command(f"set setpoint {i} 0", wait=False)
+
+		self._ack_event.clear()
+		self._ack_event.wait(self.ACK_TIMEOUT)
 
 	def connection_made(self, transport):
 		super(T962Connection, self).connection_made(transport)
@@ -84,37 +211,29 @@ class T962Connection(serial.threaded.LineReader):
 	def handle_line(self, line):
 		# print(line)
 
-		# ignore 'comments'
-		if line.startswith('#'):
-			return
+		match = self.DISPATCH_RE.match(line)
+		if match is not None:
+			kind = match.lastgroup
 
-		# parse Profile name
-		if line.startswith('Starting reflow with profile: '):
-			profile = line[30:].strip()
-			try:
-				self.consumer.reflow_started(profile)
-			except Exception as e:
-				logger.error(e, exc_info=True)
-			return
+			# 'comments' double as the command echo/ack
+			if kind == 'ack':
+				self._ack_event.set()
+				return
 
-		if line.startswith('Reflow done'):
-			try:
-				self.consumer.reflow_finished()
-			except Exception as e:
-				logger.error(e, exc_info=True)
-			return
+			# Statuses collected earlier in this chunk must reach the
+			# consumer before the control event that followed them on
+			# the wire, or e.g. a pre-start row lands in the new run.
+			self._flush_status_batch()
 
-		if line.startswith('Reflow interrupted by keypress'):
 			try:
-				self.consumer.reflow_interrupted()
-			except Exception as e:
-				logger.error(e, exc_info=True)
-			return
-
-		if line.startswith('Selected profile'):
-			profile = line[20:].strip()
-			try:
-				self.consumer.reflow_started(profile)
+				if kind == 'started':
+					self.consumer.reflow_started(line[30:].strip())
+				elif kind == 'done':
+					self.consumer.reflow_finished()
+				elif kind == 'interrupted':
+					self.consumer.reflow_interrupted()
+				elif kind == 'selected':
+					self.consumer.reflow_started(line[20:].strip())
 			except Exception as e:
 				logger.error(e, exc_info=True)
 			return
@@ -126,115 +245,392 @@ class T962Connection(serial.threaded.LineReader):
 				print('!!', line)
 			return
 
+		if self._status_batch is not None:
+			self._status_batch.append(status)
+			return
+
 		try:
 			self.consumer.status_received(status)
 		except Exception as e:
 			logger.error(e, exc_info=True)
 
 	def parse(self, line):
-		values = list(map(str.strip, line.split(',')))
-		# Convert all values to float, except the mode
-		values = list(map(float, values[0:-1])) + [values[-1], ]
-
-		fields = FIELD_NAMES.split(',')
-		if len(values) != len(fields):
-			raise ValueError('Expected %d fields, found %d' % (len(fields), len(values)))
-
-		return dict(zip(fields, values))
+		parts = line.split(',')
+		if len(parts) != 11:
+			raise ValueError('Expected 11 fields, found %d' % len(parts))
+
+		# Convert all values to float, except the mode. float() accepts
+		# surrounding whitespace, so only the mode needs a strip. Field
+		# order matches FIELD_NAMES.
+		return Status(float(parts[0]), float(parts[1]), float(parts[2]),
+					  float(parts[3]), float(parts[4]), float(parts[5]),
+					  float(parts[6]), float(parts[7]), float(parts[8]),
+					  float(parts[9]), parts[10].strip())
 
 class TemperatureProfile:
 	def __init__(self):
 		self.points = []
+		self._times_arr = None
+		self._temps_arr = None
+		self._finalized = False
+
+	@classmethod
+	def from_points(cls, points):
+		# Bulk constructor: sorts the breakpoints and builds the cached
+		# arrays once, instead of invalidating them point by point. The
+		# resulting profile is immutable -- a late add_point raises.
+		profile = cls()
+
+		arr = np.asarray(points, dtype=np.float64)
+		arr = arr[np.argsort(arr[:, 0], kind='stable')]
+
+		profile.points = [tuple(p) for p in arr]
+		profile._times_arr = arr[:, 0].copy()
+		profile._temps_arr = arr[:, 1].copy()
+		profile._times_list = profile._times_arr.tolist()
+		profile._temps_list = profile._temps_arr.tolist()
+		profile._finalized = True
+
+		return profile
 
 	def add_point(self, t, temperature):
+		if self._finalized:
+			raise ValueError('Cannot add points to a finalized profile')
+
 		self.points.append((t, temperature))
+		self._times_arr = None
+		self._temps_arr = None
 
 	def interpolate(self, t):
-		index = self.find_index(t)
-		length = len(self.points)
+		self._build_arrays()
+
+		index = bisect.bisect_right(self._times_list, t)
+		length = len(self._times_list)
 
 		if index == 0:
-			return self.points[0][1]
+			return self._temps_list[0]
 		elif index == length:
-			return self.points[length - 1][1]
+			return self._temps_list[length - 1]
 		else:
-			t0, temp0 = self.points[index - 1]
-			t1, temp1 = self.points[index]
+			t0 = self._times_list[index - 1]
+			t1 = self._times_list[index]
+			temp0 = self._temps_list[index - 1]
+			temp1 = self._temps_list[index]
 
 			f = (t - t0) / (t1 - t0)
 			return f * (temp1 - temp0) + temp0
 
+	def interpolate_many(self, ts):
+		self._build_arrays()
+		return np.interp(ts, self._times_arr, self._temps_arr)
+
 	def find_index(self, t):
-		index = 0
-		while index < len(self.points):
-			if t < self.points[index][0]:
-				return index
-			index += 1
-		return index
+		self._build_arrays()
+		return bisect.bisect_right(self._times_list, t)
+
+	def _build_arrays(self):
+		# Cached mirrors of the breakpoints, rebuilt lazily after
+		# add_point invalidates them. The ndarrays feed np.interp for
+		# batched callers; the plain lists feed bisect, whose C-level
+		# binary search beats numpy's scalar-call overhead for the
+		# one-at-a-time path.
+		if self._times_arr is None:
+			self._times_arr = np.fromiter((p[0] for p in self.points), dtype=np.float64)
+			self._temps_arr = np.fromiter((p[1] for p in self.points), dtype=np.float64)
+			self._times_list = self._times_arr.tolist()
+			self._temps_list = self._temps_arr.tolist()
 
 class ReflowData:
-	def __init__(self, profile):
-		self.profile = profile
-		self.statuses = []
-
-	def append_status(self, status):
-		self.statuses.append(status)
-
-	def values_for_key(self, key):
-		return [s[key] for s in self.statuses]
-
-	def time_values(self):
-		return self.values_for_key('Time')
-
-	def temp0_values(self):
-		return self.values_for_key('Temp0')
+	# All fields except the mode are stored as one contiguous float64
+	# column per field. The getters below return views into these
+	# columns, so retrieving a series is O(1) and matplotlib consumes
+	# the buffers directly without converting from Python lists.
+	#
+	# Order matches Status, so column i holds status field i.
+	NUMERIC_FIELDS = Status._fields[:-1]
 
-	def temp1_values(self):
-		return self.values_for_key('Temp1')
+	INITIAL_CAPACITY = 512
 
-	def temp2_values(self):
-		return self.values_for_key('Temp2')
+	# In-memory history is bounded: every status is streamed to a CSV
+	# log as it arrives, so once the columns reach this many rows the
+	# oldest half is dropped rather than growing without limit.
+	MAX_CAPACITY = 7200
 
-	def temp3_values(self):
-		return self.values_for_key('Temp3')
+	# Process-wide id()s can be recycled after a ReflowData is dropped,
+	# so instances carry a monotonic serial for cache keys instead.
+	_serial_counter = itertools.count()
 
-	def setpoint_values(self):
-		return self.values_for_key('Set')
-
-	def average_values(self):
-		return self.values_for_key('Actual')
-
-	def cold_junction_values(self):
-		return self.values_for_key('ColdJ')
-
-	def heat_values(self):
-		return list(map(lambda x: x * (100.0 / 256.0), self.values_for_key('Heat')))
+	def __init__(self, profile):
+		self.profile = profile
+		self.serial = next(self._serial_counter)
+		self.trim_count = 0
+
+		self._capacity = self.INITIAL_CAPACITY
+		self._columns = {field: np.empty(self._capacity, dtype=np.float64)
+						 for field in self.NUMERIC_FIELDS}
+		self._modes = []
+		self._n = 0
+
+		# Running extrema per column, updated as rows are appended so
+		# axis-limit checks never have to rescan the history. They are
+		# deliberately not shrunk when old rows are dropped -- like the
+		# plot limits, they only ever widen.
+		self._lo = {field: np.inf for field in self.NUMERIC_FIELDS}
+		self._hi = {field: -np.inf for field in self.NUMERIC_FIELDS}
 
-	def fan_values(self):
-		return list(map(lambda x: x * (100.0 / 256.0), self.values_for_key('Fan')))
+	def append_status(self, status):
+		self.append_statuses((status,))
+
+	def append_statuses(self, statuses):
+		# Single-producer/single-consumer discipline: exactly one thread
+		# (the GUI loop, via EventConsumer.drain) writes. Rows are
+		# written (and, if needed, grown arrays swapped in) *before* the
+		# new count is published, so any reader can snapshot length()
+		# once per frame and read the columns below it without a lock
+		# and without tearing.
+		if len(statuses) > self.MAX_CAPACITY:
+			statuses = statuses[-self.MAX_CAPACITY:]
+
+		end = self._n + len(statuses)
+		while end > self._capacity:
+			if self._capacity < self.MAX_CAPACITY:
+				self._grow()
+			else:
+				self._drop_oldest()
+			end = self._n + len(statuses)
+
+		for i, field in enumerate(self.NUMERIC_FIELDS):
+			column = self._columns[field]
+			column[self._n:end] = [s[i] for s in statuses]
+
+			lo = column[self._n:end].min()
+			hi = column[self._n:end].max()
+			if lo < self._lo[field]:
+				self._lo[field] = lo
+			if hi > self._hi[field]:
+				self._hi[field] = hi
+		self._modes.extend(s.Mode for s in statuses)
+
+		# Publish last; under the GIL this acts as the release store.
+		self._n = end
+
+	def length(self):
+		return self._n
+
+	def values_for_key(self, key, n=None):
+		if n is None:
+			n = self._n
+		return self._columns[key][:n]
+
+	def value_range(self, key):
+		if self._n == 0:
+			return None
+		return (self._lo[key], self._hi[key])
+
+	def heat_range(self):
+		return self._scaled_range('Heat')
+
+	def fan_range(self):
+		return self._scaled_range('Fan')
+
+	def _scaled_range(self, key):
+		value_range = self.value_range(key)
+		if value_range is None:
+			return None
+		return (value_range[0] * (100.0 / 256.0),
+				value_range[1] * (100.0 / 256.0))
+
+	def _grow(self):
+		# Clamp the doubling at MAX_CAPACITY so the documented bound is
+		# the real one (512 * 2^k would otherwise step past it to 8192).
+		self._capacity = min(self._capacity * 2, self.MAX_CAPACITY)
+		for field, column in self._columns.items():
+			grown = np.empty(self._capacity, dtype=np.float64)
+			grown[:self._n] = column[:self._n]
+			self._columns[field] = grown
+
+	def _drop_oldest(self):
+		# Drop the oldest half of the window; the streamed CSV keeps
+		# the complete record. The reduced count is published before
+		# the trimmed arrays are swapped in, so a reader observes a
+		# count no larger than the valid rows of whichever arrays it
+		# sees (old arrays keep the old rows, trimmed ones the tail).
+		kept = self._n // 2
+		drop = self._n - kept
+
+		self._modes = self._modes[drop:]
+		self._n = kept
+		self.trim_count += 1
+
+		for field, column in self._columns.items():
+			trimmed = np.empty(self._capacity, dtype=np.float64)
+			trimmed[:kept] = column[drop:drop + kept]
+			self._columns[field] = trimmed
+
+	def time_values(self, n=None):
+		return self.values_for_key('Time', n)
+
+	def temp0_values(self, n=None):
+		return self.values_for_key('Temp0', n)
+
+	def temp1_values(self, n=None):
+		return self.values_for_key('Temp1', n)
+
+	def temp2_values(self, n=None):
+		return self.values_for_key('Temp2', n)
+
+	def temp3_values(self, n=None):
+		return self.values_for_key('Temp3', n)
+
+	def setpoint_values(self, n=None):
+		return self.values_for_key('Set', n)
+
+	def average_values(self, n=None):
+		return self.values_for_key('Actual', n)
+
+	def cold_junction_values(self, n=None):
+		return self.values_for_key('ColdJ', n)
+
+	def heat_values(self, n=None):
+		return self.values_for_key('Heat', n) * (100.0 / 256.0)
+
+	def fan_values(self, n=None):
+		return self.values_for_key('Fan', n) * (100.0 / 256.0)
 
 class EventConsumer:
+	# At most this many queued events are applied per drain() call, so
+	# a burst of serial traffic can't starve the render loop.
+	MAX_DRAIN = 256
+
 	def __init__(self):
 		self.reflow_data = ReflowData('Unknown')
+		self.dirty = False
+		self.data_ready = Event()
+
+		self._events = queue.SimpleQueue()
+		self._fields = FIELD_NAMES.split(',')
+		self._csv_file = None
+		self._csv_writer = None
+
+	# The methods below run on the serial RX thread. They only enqueue
+	# and wake the GUI loop; all real work (column appends, CSV writes,
+	# log rotation) happens on the GUI thread in drain(), which also
+	# keeps event ordering intact.
 
 	def reflow_started(self, profile):
-		self.reflow_data = ReflowData(profile)
+		self._events.put(('started', profile))
+		self.data_ready.set()
 		return
 
 	def reflow_finished(self):
+		self._events.put(('finished', None))
+		self.data_ready.set()
 		return
 
 	def reflow_interrupted(self):
+		self._events.put(('interrupted', None))
+		self.data_ready.set()
 		return
 
 	def profile_selected(self, profile):
 		return
 
 	def status_received(self, status):
-		if self.reflow_data == None:
-			self.reflow_data = ReflowData('Unknown')
-		self.reflow_data.append_status(status)
+		self.status_batch_received((status,))
+
+	def status_batch_received(self, statuses):
+		self._events.put(('statuses', statuses))
+		self.data_ready.set()
+
+	def drain(self):
+		for _ in range(self.MAX_DRAIN):
+			try:
+				kind, payload = self._events.get_nowait()
+			except queue.Empty:
+				return
+			self._apply(kind, payload)
+
+		# Hit the cap with events still queued; make sure the next
+		# loop iteration wakes immediately to keep draining.
+		if not self._events.empty():
+			self.data_ready.set()
+
+	def _apply(self, kind, payload):
+		if kind == 'statuses':
+			if self.reflow_data == None:
+				self.reflow_data = ReflowData('Unknown')
+			self.reflow_data.append_statuses(payload)
+
+			# Persist every status as it streams in; with the in-memory
+			# window bounded, the CSV is the complete record of the run.
+			if self._csv_writer is None:
+				self._rotate_log(self.reflow_data.profile)
+			if self._csv_writer is not None:
+				# Status tuples are already in FIELD_NAMES order.
+				self._csv_writer.writerows(payload)
+				self._csv_file.flush()
+
+			self.dirty = True
+
+		elif kind == 'started':
+			self.reflow_data = ReflowData(payload)
+			self._rotate_log(payload)
+			self.dirty = True
+
+		elif kind in ('finished', 'interrupted'):
+			self._close_log()
+
+	def _rotate_log(self, profile):
+		self._close_log()
+
+		try:
+			self._csv_file = open(logname('csv', profile), 'w', newline='')
+		except OSError as e:
+			logger.error(e, exc_info=True)
+			self._csv_file = None
+			return
+
+		self._csv_writer = csv.writer(self._csv_file)
+		self._csv_writer.writerow(self._fields)
+
+	def _close_log(self):
+		if self._csv_file is not None:
+			self._csv_file.close()
+		self._csv_file = None
+		self._csv_writer = None
+
 
+def lttb_downsample(x, y, n_out):
+	# Largest-Triangle-Three-Buckets: picks the point in each bucket
+	# that forms the largest triangle with the previously chosen point
+	# and the average of the next bucket, preserving the visual shape
+	# of the series. The first and last points are always kept.
+	n = len(x)
+	if n_out >= n or n_out < 3:
+		return x, y
+
+	edges = np.linspace(1, n - 1, n_out - 1, dtype=np.int64)
+
+	chosen = np.empty(n_out, dtype=np.int64)
+	chosen[0] = 0
+	chosen[n_out - 1] = n - 1
+
+	a = 0
+	for i in range(n_out - 2):
+		lo = edges[i]
+		hi = edges[i + 1]
+
+		next_hi = edges[i + 2] if i < n_out - 3 else n
+		avg_x = x[hi:next_hi].mean()
+		avg_y = y[hi:next_hi].mean()
+
+		areas = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) -
+					   (x[a] - x[lo:hi]) * (avg_y - y[a]))
+
+		a = lo + int(np.argmax(areas))
+		chosen[i + 1] = a
+
+	return x[chosen], y[chosen]
 
 class ReflowView:
 	def __init__(self):
@@ -242,124 +638,203 @@ class ReflowView:
 		self.temp_limits = [0, 275]
 		self.pwm_limits = [-5, 105]
 
+		# The toolbar was only hidden before (pack_forget), which still
+		# left its artists to be composited. Disable it outright.
+		matplotlib.rcParams['toolbar'] = 'None'
+
 		self.fig = plt.figure(figsize=(15, 12))
 		self.fig.canvas.set_window_title('Reflow Profile')
 
 		self.temp_top_axes = self.fig.add_subplot(7, 1, (1, 2))
-		self.temp_pcb_axes = self.fig.add_subplot(7, 1, (3, 4))
-		self.temp_pid_axes = self.fig.add_subplot(7, 1, (5, 6))
-		self.pwm_axes = self.fig.add_subplot(7, 1, 7)
+		self.temp_pcb_axes = self.fig.add_subplot(7, 1, (3, 4), sharex=self.temp_top_axes)
+		self.temp_pid_axes = self.fig.add_subplot(7, 1, (5, 6), sharex=self.temp_top_axes)
+		self.pwm_axes = self.fig.add_subplot(7, 1, 7, sharex=self.temp_top_axes)
 
 		# Temperature Sensors (Top)
 
-		self.temp_top_sp_plot, = self.temp_top_axes.plot([], [], label='Set Point', 	linewidth=2, color='#000000', zorder=1)
-		self.temp_top_t0_plot, = self.temp_top_axes.plot([], [], label='Air Sensor A', 	linewidth=1, color='#008000', zorder=2)
-		self.temp_top_t1_plot, = self.temp_top_axes.plot([], [], label='Air Sensor B', 	linewidth=1, color='#0000d0', zorder=2)
+		self.temp_top_sp_plot, = self.temp_top_axes.plot([], [], label='Set Point', 	linewidth=2, color='#000000', zorder=1, animated=True)
+		self.temp_top_t0_plot, = self.temp_top_axes.plot([], [], label='Air Sensor A', 	linewidth=1, color='#008000', zorder=2, animated=True)
+		self.temp_top_t1_plot, = self.temp_top_axes.plot([], [], label='Air Sensor B', 	linewidth=1, color='#0000d0', zorder=2, animated=True)
 
 		self.temp_top_axes.grid(True, color='#dddddd')
-		self.temp_top_axes.set_xticklabels([])
+		self.temp_top_axes.tick_params(labelbottom=False)
 		self.temp_top_axes.set_ylabel('Temperature [°C]')
 		self.temp_top_axes.legend(loc='upper left')
 
 		# Temperature Sensors (Aux)
 
-		self.temp_pcb_sp_plot, = self.temp_pcb_axes.plot([], [], label='Set Point', 	linewidth=2, color='#000000', zorder=1)
-		self.temp_pcb_t2_plot, = self.temp_pcb_axes.plot([], [], label='PCB Sensor A', 	linewidth=1, color='#008000', zorder=2)
-		self.temp_pcb_t3_plot, = self.temp_pcb_axes.plot([], [], label='PCB Sensor B', 	linewidth=1, color='#0000d0', zorder=2)
+		self.temp_pcb_sp_plot, = self.temp_pcb_axes.plot([], [], label='Set Point', 	linewidth=2, color='#000000', zorder=1, animated=True)
+		self.temp_pcb_t2_plot, = self.temp_pcb_axes.plot([], [], label='PCB Sensor A', 	linewidth=1, color='#008000', zorder=2, animated=True)
+		self.temp_pcb_t3_plot, = self.temp_pcb_axes.plot([], [], label='PCB Sensor B', 	linewidth=1, color='#0000d0', zorder=2, animated=True)
 
 		self.temp_pcb_axes.grid(True, color='#dddddd')
-		self.temp_pcb_axes.set_xticklabels([])
+		self.temp_pcb_axes.tick_params(labelbottom=False)
 		self.temp_pcb_axes.set_ylabel('Temperature [°C]')
 		self.temp_pcb_axes.legend(loc='upper left')
 
 		# Temperature PID Inputs
 
-		self.temp_pid_sp_plot, = self.temp_pid_axes.plot([], [], label='Set Point', linewidth=2, color='#000000', zorder=1)
-		self.temp_pid_in_plot, = self.temp_pid_axes.plot([], [], label='PID Input', linewidth=1, color='#800000', zorder=2)
+		self.temp_pid_sp_plot, = self.temp_pid_axes.plot([], [], label='Set Point', linewidth=2, color='#000000', zorder=1, animated=True)
+		self.temp_pid_in_plot, = self.temp_pid_axes.plot([], [], label='PID Input', linewidth=1, color='#800000', zorder=2, animated=True)
 		
 		self.temp_pid_axes.grid(True, color='#dddddd')
-		self.temp_pid_axes.set_xticklabels([])
-		self.temp_pid_axes.set_ylabel('Temperature [°C]')		
+		self.temp_pid_axes.tick_params(labelbottom=False)
+		self.temp_pid_axes.set_ylabel('Temperature [°C]')
 		self.temp_pid_axes.legend(loc='upper left')
 
 		# PWM Outputs
 
-		self.heater_plot, = self.pwm_axes.plot([], [], label='Heater', 	linewidth=1, color='#ee9900')
-		self.fan_plot, 	  = self.pwm_axes.plot([], [], label='Fan', linewidth=1, color='#4444ff')
+		self.heater_plot, = self.pwm_axes.plot([], [], label='Heater', 	linewidth=1, color='#ee9900', animated=True)
+		self.fan_plot, 	  = self.pwm_axes.plot([], [], label='Fan', linewidth=1, color='#4444ff', animated=True)
 		
 		self.pwm_axes.grid(True, color='#dddddd')
 		self.pwm_axes.set_ylabel('Duty Cycle [%]')
 		self.pwm_axes.set_xlabel('Time [seconds]')		
 		self.pwm_axes.legend(loc='upper left')
 
-		self.fig.canvas.toolbar.pack_forget()
 		self.fig.tight_layout()
 
-
-
-		self.profile = TemperatureProfile()
-		self.profile.add_point(30, 25)
-		self.profile.add_point(90, 150)
-		self.profile.add_point(150, 180)
-		self.profile.add_point(175, 230)
-		self.profile.add_point(200, 230)
-		self.profile.add_point(300, 25)
+		# The animated lines are redrawn by blitting them over a cached
+		# background instead of re-compositing the whole figure on every
+		# status message. Animated artists are skipped by full draws, so
+		# every full draw (first frame, resize, window expose) triggers
+		# _on_draw, which recaptures the background and re-composites
+		# the lines on top of it.
+		self._animated_plots = [
+			(self.temp_top_axes, self.temp_top_sp_plot),
+			(self.temp_top_axes, self.temp_top_t0_plot),
+			(self.temp_top_axes, self.temp_top_t1_plot),
+
+			(self.temp_pcb_axes, self.temp_pcb_sp_plot),
+			(self.temp_pcb_axes, self.temp_pcb_t2_plot),
+			(self.temp_pcb_axes, self.temp_pcb_t3_plot),
+
+			(self.temp_pid_axes, self.temp_pid_sp_plot),
+			(self.temp_pid_axes, self.temp_pid_in_plot),
+
+			(self.pwm_axes, self.heater_plot),
+			(self.pwm_axes, self.fan_plot),
+		]
+
+		self._background = None
+		self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+		# Cap the number of points handed to each Line2D. Beyond roughly
+		# two points per pixel of axis width, extra points only add Agg
+		# stroking cost without changing the rendered curve.
+		self._target_points = 800
+		self._downsample_cache = {}
+		self._downsample_key = None
+
+		self.profile = TemperatureProfile.from_points([
+			(30, 25),
+			(90, 150),
+			(150, 180),
+			(175, 230),
+			(200, 230),
+			(300, 25),
+		])
+
+		# The profile is immutable once built, so its plotted curve can
+		# be interpolated here in one numpy call instead of point by
+		# point on every update.
+		self._ptimes = np.arange(0, 400, dtype=np.float64)
+		self._ptemps = self.profile.interpolate_many(self._ptimes)
+		self._ptimes_range = (self._ptimes[0], self._ptimes[-1])
+		self._ptemps_range = (self._ptemps.min(), self._ptemps.max())
+		self._profile_drawn = False
 
 
 	def update(self, reflow_data):
 		# Profile data
 
-		ptimes = list(range(0, 400, 1))
-		ptemps = [self.profile.interpolate(t) for t in ptimes]
+		ptimes = self._ptimes
+		ptemps = self._ptemps
 
 		# Retrieve data points
 
-		time_values = reflow_data.time_values()
-		temp0_values = reflow_data.temp0_values()
-		temp1_values = reflow_data.temp1_values()
-		temp2_values = reflow_data.temp2_values()
-		temp3_values = reflow_data.temp3_values()
+		# The downsample cache is keyed by series length, which is only
+		# unique within a single untrimmed run; reset it whenever the
+		# backing data changes identity or drops rows.
+		data_key = (reflow_data.serial, reflow_data.trim_count)
+		if data_key != self._downsample_key:
+			self._downsample_cache.clear()
+			self._downsample_key = data_key
 
-		setpoint_values = reflow_data.setpoint_values()
-		average_values = reflow_data.average_values()
-
-		heater_values = reflow_data.heat_values()
-		fan_values = reflow_data.fan_values()
-
-		# Update axes limits
+		# Snapshot the row count once so every series below reflects the
+		# same instant, even while the serial thread keeps appending.
+		n = reflow_data.length()
 
-		self._update_limits_from_values(self.time_limits, time_values,
-														  ptimes)
+		time_values = reflow_data.time_values(n)
+		temp0_values = reflow_data.temp0_values(n)
+		temp1_values = reflow_data.temp1_values(n)
+		temp2_values = reflow_data.temp2_values(n)
+		temp3_values = reflow_data.temp3_values(n)
 
+		setpoint_values = reflow_data.setpoint_values(n)
+		average_values = reflow_data.average_values(n)
 
-		self._update_limits_from_values(self.temp_limits, temp0_values,
-														  temp1_values,
-														  temp2_values,
-														  temp3_values,
-														  setpoint_values,
-		 												  average_values,
-		 												  ptemps)
+		heater_values = reflow_data.heat_values(n)
+		fan_values = reflow_data.fan_values(n)
 
-		self._update_limits_from_values(self.pwm_limits,  heater_values,
-														  fan_values)
-
-		self._set_axes_limits()
-
-		self.temp_top_t0_plot.set_data(time_values, temp0_values)
-		self.temp_top_t1_plot.set_data(time_values, temp1_values)
-		self.temp_top_sp_plot.set_data(time_values, setpoint_values)
-
-		self.temp_pcb_t2_plot.set_data(time_values, temp2_values)
-		self.temp_pcb_t3_plot.set_data(time_values, temp3_values)
-		self.temp_pcb_sp_plot.set_data(ptimes, ptemps)
-		
-		self.temp_pid_in_plot.set_data(time_values, average_values)
-		self.temp_pid_sp_plot.set_data(time_values, setpoint_values)
-
-		self.heater_plot.set_data(time_values, heater_values)
-		self.fan_plot.set_data(time_values, fan_values)
-
-		plt.draw()
+		# Update axes limits
+		#
+		# The data extrema are maintained incrementally at append time,
+		# so this only compares cached ranges instead of rescanning
+		# every series each frame.
+
+		limits_dirty = False
+
+		limits_dirty |= self._update_limits_from_ranges(self.time_limits,
+														reflow_data.value_range('Time'),
+														self._ptimes_range)
+
+		limits_dirty |= self._update_limits_from_ranges(self.temp_limits,
+														reflow_data.value_range('Temp0'),
+														reflow_data.value_range('Temp1'),
+														reflow_data.value_range('Temp2'),
+														reflow_data.value_range('Temp3'),
+														reflow_data.value_range('Set'),
+														reflow_data.value_range('Actual'),
+														self._ptemps_range)
+
+		limits_dirty |= self._update_limits_from_ranges(self.pwm_limits,
+														reflow_data.heat_range(),
+														reflow_data.fan_range())
+
+		self._set_plot_data(self.temp_top_t0_plot, time_values, temp0_values)
+		self._set_plot_data(self.temp_top_t1_plot, time_values, temp1_values)
+		self._set_plot_data(self.temp_top_sp_plot, time_values, setpoint_values)
+
+		self._set_plot_data(self.temp_pcb_t2_plot, time_values, temp2_values)
+		self._set_plot_data(self.temp_pcb_t3_plot, time_values, temp3_values)
+		if not self._profile_drawn:
+			self.temp_pcb_sp_plot.set_xdata(ptimes)
+			self.temp_pcb_sp_plot.set_ydata(ptemps)
+			self._profile_drawn = True
+
+		self._set_plot_data(self.temp_pid_in_plot, time_values, average_values)
+		self._set_plot_data(self.temp_pid_sp_plot, time_values, setpoint_values)
+
+		self._set_plot_data(self.heater_plot, time_values, heater_values)
+		self._set_plot_data(self.fan_plot, time_values, fan_values)
+
+		# Redraw
+
+		canvas = self.fig.canvas
+
+		# A full draw is only needed when the axes limits moved (or the
+		# cached background doesn't exist yet). It fires _on_draw, which
+		# refreshes the cached background for the blit below.
+		if limits_dirty or self._background is None:
+			self._set_axes_limits()
+			canvas.draw()
+
+		canvas.restore_region(self._background)
+		for axes, plot in self._animated_plots:
+			axes.draw_artist(plot)
+		canvas.blit(self.fig.bbox)
+		canvas.flush_events()
 
 	def run_event_loop(self, interval):
 		# The following code replaces the common pyplot idoim `pause()`.
@@ -381,44 +856,79 @@ class ReflowView:
 				canvas.start_event_loop(interval)
 				return		
 
-	def _update_limits_from_values(self, limits, *values_list):
-		for values in values_list:
-			if len(values) == 0:
+	def _on_draw(self, event):
+		# Runs after every full draw, including ones the GUI initiates
+		# itself (resize, expose). Recapture the background and paint
+		# the animated lines back on, so they stay visible even when no
+		# data-driven update() follows.
+		canvas = self.fig.canvas
+		self._background = canvas.copy_from_bbox(self.fig.bbox)
+		for axes, plot in self._animated_plots:
+			axes.draw_artist(plot)
+
+	def _set_plot_data(self, plot, x, y):
+		if len(x) > self._target_points:
+			x, y = self._downsampled(plot, x, y)
+
+		# Hand matplotlib the ndarray views directly. Unlike set_data
+		# with Python lists, this skips the re-cast to ndarray, and
+		# passing the same x view each frame lets matplotlib reuse its
+		# cached transform work for the unchanged axis.
+		plot.set_xdata(x)
+		plot.set_ydata(y)
+
+	def _downsampled(self, plot, x, y):
+		# Since statuses only ever append, the series length is enough
+		# of a fingerprint to reuse the previous frame's result.
+		cached = self._downsample_cache.get(plot)
+		if cached is not None and cached[0] == len(x):
+			return cached[1], cached[2]
+
+		xd, yd = lttb_downsample(x, y, self._target_points)
+		self._downsample_cache[plot] = (len(x), xd, yd)
+		return xd, yd
+
+	def _update_limits_from_ranges(self, limits, *ranges):
+		changed = False
+
+		for value_range in ranges:
+			if value_range is None:
 				continue
 
-			min_value = min(values)
-			max_value = max(values)
+			min_value, max_value = value_range
 
 			if limits[0] > min_value:
 				limits[0] = min_value
+				changed = True
 			if limits[1] < max_value:
 				limits[1] = max_value
+				changed = True
+
+		return changed
 
 	def _set_axes_limits(self):
+		# The x axis is shared, so setting it once propagates to all
+		# four panes.
 		self.temp_top_axes.set_xlim(*self.time_limits)
-		self.temp_top_axes.set_ylim(*self.temp_limits)
 
-		self.temp_pcb_axes.set_xlim(*self.time_limits)
+		self.temp_top_axes.set_ylim(*self.temp_limits)
 		self.temp_pcb_axes.set_ylim(*self.temp_limits)
-
-		self.temp_pid_axes.set_xlim(*self.time_limits)
 		self.temp_pid_axes.set_ylim(*self.temp_limits)
-
-		self.pwm_axes.set_xlim(*self.time_limits)
 		self.pwm_axes.set_ylim(*self.pwm_limits)
 
 
 def main():
 
-	air_profile = TemperatureProfile()
-	air_profile.add_point(30, 25)
-	air_profile.add_point(90, 150)
-	air_profile.add_point(150, 180)
-	air_profile.add_point(175, 230)
-	air_profile.add_point(200, 230)
-	air_profile.add_point(300, 25)
+	air_profile = TemperatureProfile.from_points([
+		(30, 25),
+		(90, 150),
+		(150, 180),
+		(175, 230),
+		(200, 230),
+		(300, 25),
+	])
 
-	aptemps = [air_profile.interpolate(t) for t in range(0, 300, 10)]
+	aptemps = air_profile.interpolate_many(np.arange(0, 300, 10))
 
 	consumer = EventConsumer()
 	reflow_view = ReflowView()
@@ -447,10 +957,25 @@ def main():
 				# conn.send_command("select profile 5")
 				# conn.send_command("reflow")
 
+				# Sleep at OS level until the serial thread signals new
+				# data (or the timeout lapses), then redraw at most every
+				# DRAW_INTERVAL seconds. Idle CPU use drops to ~0 and the
+				# response to a new batch is bounded by the wakeup, not a
+				# fixed 1-second poll.
+				last_draw = 0.0
 				while True:
-					if consumer.reflow_data != None:
-						reflow_view.update(consumer.reflow_data)
-					reflow_view.run_event_loop(1)
+					consumer.data_ready.wait(timeout=DRAW_INTERVAL)
+					consumer.data_ready.clear()
+					consumer.drain()
+
+					now = time.monotonic()
+					if consumer.dirty and now - last_draw >= DRAW_INTERVAL:
+						consumer.dirty = False
+						if consumer.reflow_data != None:
+							reflow_view.update(consumer.reflow_data)
+						last_draw = now
+
+					reflow_view.run_event_loop(0.05)
 			finally:
 				conn.send_command("stop")
 	except KeyboardInterrupt: